@@ -1,5 +1,6 @@
 import os
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Literal
 
 
@@ -24,6 +25,10 @@ class Settings:
         self.service_name = os.getenv("SERVICE_NAME", self.service_name)
 
 
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    """Get application settings instance."""
+    """Get cached application settings instance.
+
+    Call ``get_settings.cache_clear()`` after changing the environment.
+    """
     return Settings()
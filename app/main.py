@@ -1,19 +1,22 @@
 import logging
 import uuid
+from datetime import datetime, timezone
 from typing import Annotated
 
 from fastapi import Depends, FastAPI, HTTPException, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import JSONResponse
 
 from app.config import get_settings
-from app.schemas import DataBatch
+from app.schemas import DataBatch, HealthResponse, IngestResponse
 from app.storage import Storage, get_storage_from_env, StorageError
-from app.transform import transform_item
+from app.transform import transform_batch
 
 # Configure logging
 settings = get_settings()
 logging.basicConfig(
-    level=getattr(logging, settings.log_level),
+    level=settings.log_level,
     format='%(asctime)s %(levelname)s %(name)s %(message)s'
 )
 logger = logging.getLogger(__name__)
@@ -33,8 +36,19 @@ class RequestIDMiddleware:
     
     async def __call__(self, scope, receive, send):
         if scope["type"] == "http":
-            request = Request(scope, receive)
-            request_id = request.headers.get("X-Request-ID", str(uuid.uuid4()))
+            # Read the header straight from the ASGI scope (names are lowercase bytes)
+            request_id_bytes = None
+            for name, value in scope["headers"]:
+                if name == b"x-request-id":
+                    request_id_bytes = value
+                    break
+            
+            if request_id_bytes:
+                request_id = request_id_bytes.decode("latin-1")
+            else:
+                request_id = uuid.uuid4().hex
+                request_id_bytes = request_id.encode("latin-1")
+            request_id_header = (b"x-request-id", request_id_bytes)
             
             # Add request ID to scope for logging
             scope["request_id"] = request_id
@@ -42,7 +56,7 @@ class RequestIDMiddleware:
             # Create response wrapper to add X-Request-ID header
             async def send_with_request_id(message):
                 if message["type"] == "http.response.start":
-                    message["headers"].append((b"X-Request-ID", request_id.encode()))
+                    message["headers"] = [*message.get("headers", ()), request_id_header]
                 await send(message)
             
             await self.app(scope, receive, send_with_request_id)
@@ -51,12 +65,14 @@ class RequestIDMiddleware:
 
 
 app.add_middleware(RequestIDMiddleware)
+# Compress large responses such as /ingest key lists; small ones pass through
+app.add_middleware(GZipMiddleware, minimum_size=1024)
 
 
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
     """Global exception handler for unhandled exceptions."""
-    logger.exception(f"Unhandled exception: {exc}")
+    logger.exception("Unhandled exception: %s", exc)
     return JSONResponse(
         status_code=500,
         content={"detail": "Internal Server Error"}
@@ -64,22 +80,30 @@ async def global_exception_handler(request: Request, exc: Exception):
 
 
 @app.get("/health")
-async def health_check():
+async def health_check() -> HealthResponse:
     """Health check endpoint."""
     settings = get_settings()
-    return {
-        "status": "ok",
-        "storage_backend": settings.storage_backend,
-        "region": settings.aws_region
-    }
+    return HealthResponse(
+        status="ok",
+        storage_backend=settings.storage_backend,
+        region=settings.aws_region
+    )
+
 
+async def get_storage() -> Storage:
+    """Dependency to get the cached storage backend.
 
-def get_storage() -> Storage:
-    """Dependency to get storage backend."""
+    Declared async so FastAPI resolves it on the event loop instead of
+    dispatching it to the threadpool on every request. The first call builds
+    the boto3 client (credential resolution may hit the network) in the
+    threadpool; later calls return the cached instance directly.
+    """
     try:
-        return get_storage_from_env()
+        if get_storage_from_env.cache_info().currsize:
+            return get_storage_from_env()
+        return await run_in_threadpool(get_storage_from_env)
     except StorageError as e:
-        logger.error(f"Storage configuration error: {e}")
+        logger.error("Storage configuration error: %s", e)
         raise HTTPException(status_code=500, detail=f"Storage error: {e}")
 
 
@@ -87,26 +111,26 @@ def get_storage() -> Storage:
 async def ingest_data(
     data_batch: DataBatch,
     storage: Annotated[Storage, Depends(get_storage)]
-):
+) -> IngestResponse:
     """Ingest data batch and store to configured backend."""
     
     try:
-        # Transform each item
-        transformed_items = [transform_item(item) for item in data_batch.items]
+        # Transform each item with one shared receive time for the batch
+        transformed_items = transform_batch(data_batch.items, datetime.now(timezone.utc))
         
-        # Store items
-        keys = storage.store_batch(transformed_items)
+        # Store items off the event loop, boto3 calls are blocking
+        keys = await run_in_threadpool(storage.store_batch, transformed_items)
         
-        logger.info(f"Successfully ingested {len(transformed_items)} items")
+        logger.info("Successfully ingested %d items", len(transformed_items))
         
-        return {
-            "stored": len(transformed_items),
-            "keys": keys
-        }
+        return IngestResponse(
+            stored=len(transformed_items),
+            keys=keys
+        )
         
     except StorageError as e:
-        logger.error(f"Storage error during ingest: {e}")
+        logger.error("Storage error during ingest: %s", e)
         raise HTTPException(status_code=500, detail=f"Storage error: {e}")
     except Exception as e:
-        logger.exception(f"Unexpected error during ingest: {e}")
+        logger.exception("Unexpected error during ingest: %s", e)
         raise HTTPException(status_code=500, detail="Internal Server Error")
@@ -1,7 +1,8 @@
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 
 
 class DataItemIn(BaseModel):
@@ -18,16 +19,35 @@ class DataBatch(BaseModel):
     """Batch of input data items."""
     
     items: list[DataItemIn] = Field(..., min_length=1)
+    
+    @model_validator(mode="after")
+    def check_unique_ids(self) -> "DataBatch":
+        """Reject repeated ids, which would share a storage key within one batch."""
+        seen = set()
+        duplicates = set()
+        for item in self.items:
+            if item.id in seen:
+                duplicates.add(item.id)
+            seen.add(item.id)
+        
+        if duplicates:
+            raise ValueError(f"Duplicate item ids in batch: {', '.join(sorted(duplicates))}")
+        return self
+
 
+@dataclass(slots=True, kw_only=True)
+class DataItemOut:
+    """Output data item with transformed fields.
 
-class DataItemOut(BaseModel):
-    """Output data item schema with transformed fields."""
+    Built server-side from validated input, so it is a plain dataclass and
+    skips pydantic validation on construction.
+    """
     
     id: str
     name: str
     value: float
     timestamp: datetime | None = None
-    metadata: dict[str, Any] = Field(default_factory=dict)
+    metadata: dict[str, Any] = field(default_factory=dict)
     
     # Transformed fields
     slug: str
@@ -35,3 +55,18 @@ class DataItemOut(BaseModel):
     value_times_two: float
     received_at: datetime
     sk: str
+
+
+class IngestResponse(BaseModel):
+    """Response for a stored batch."""
+    
+    stored: int
+    keys: list[str]
+
+
+class HealthResponse(BaseModel):
+    """Health check response."""
+    
+    status: str
+    storage_backend: str
+    region: str
@@ -1,17 +1,31 @@
 import json
 import logging
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from decimal import Decimal
-from typing import Any
+from functools import lru_cache
 
 import boto3
+from boto3.dynamodb.table import BatchWriter
+from botocore.config import Config
 from botocore.exceptions import BotoCoreError, ClientError
+from pydantic import TypeAdapter
 
 from app.config import get_settings
 from app.schemas import DataItemOut
 
 logger = logging.getLogger(__name__)
 
+# Shared botocore config: a larger keep-alive pool for concurrent ingest
+# and adaptive retries for throttling.
+BOTO_CONFIG = Config(
+    max_pool_connections=64,
+    retries={"max_attempts": 3, "mode": "adaptive"}
+)
+
+# Serializes DataItemOut dataclasses to JSON bytes in pydantic-core
+ITEM_ADAPTER = TypeAdapter(DataItemOut)
+
 
 class StorageError(Exception):
     """Custom exception for storage operations."""
@@ -30,37 +44,42 @@ class Storage(ABC):
 class S3Storage(Storage):
     """S3 storage implementation."""
     
-    def __init__(self, bucket_name: str, region: str = "us-east-1"):
+    def __init__(self, bucket_name: str, region: str = "us-east-1", max_workers: int = 16):
         self.bucket_name = bucket_name
-        self.s3_client = boto3.client("s3", region_name=region)
+        self.s3_client = boto3.client("s3", region_name=region, config=BOTO_CONFIG)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+    
+    def _put_one(self, entry: tuple[str, str, bytes]) -> str:
+        """Upload a single serialized item to S3 and return its key."""
+        item_id, key, body = entry
+        
+        try:
+            self.s3_client.put_object(
+                Bucket=self.bucket_name,
+                Key=key,
+                Body=body,
+                ContentType="application/json"
+            )
+        except (BotoCoreError, ClientError) as e:
+            logger.exception("Failed to store item %s to S3: %s", item_id, e)
+            raise StorageError(f"S3 storage error: {e}")
+        
+        logger.debug("Stored item %s to S3: %s", item_id, key)
+        return key
     
     def store_batch(self, items: list[DataItemOut]) -> list[str]:
-        """Store items to S3 and return S3 keys."""
-        keys = []
+        """Store items to S3 concurrently and return S3 keys in input order."""
+        # Build items/{id}-{sk}.json keys and JSON bodies on the calling thread;
+        # only the uploads run in the pool
+        entries = [
+            (item.id, f"items/{item.id}-{item.sk}.json", ITEM_ADAPTER.dump_json(item))
+            for item in items
+        ]
         
-        for item in items:
-            # Create S3 key: items/{id}-{received_at}.json
-            key = f"items/{item.id}-{item.received_at.isoformat()}.json"
-            
-            try:
-                # Convert item to JSON with datetime serialization
-                item_data = item.model_dump(mode="json")
-                
-                # Upload to S3
-                self.s3_client.put_object(
-                    Bucket=self.bucket_name,
-                    Key=key,
-                    Body=json.dumps(item_data, default=str),
-                    ContentType="application/json"
-                )
-                
-                keys.append(key)
-                logger.info(f"Stored item {item.id} to S3: {key}")
-                
-            except (BotoCoreError, ClientError) as e:
-                logger.exception(f"Failed to store item {item.id} to S3: {e}")
-                raise StorageError(f"S3 storage error: {e}")
+        # map() preserves ordering and cancels pending uploads on the first error
+        keys = list(self._executor.map(self._put_one, entries))
         
+        logger.info("Stored %d items to S3 bucket %s", len(keys), self.bucket_name)
         return keys
 
 
@@ -69,51 +88,51 @@ class DynamoDBStorage(Storage):
     
     def __init__(self, table_name: str, region: str = "us-east-1"):
         self.table_name = table_name
-        self.dynamodb = boto3.resource("dynamodb", region_name=region)
+        self.dynamodb = boto3.resource("dynamodb", region_name=region, config=BOTO_CONFIG)
         self.table = self.dynamodb.Table(table_name)
     
+    def _put_one(self, batch: BatchWriter, item: DataItemOut) -> str:
+        """Queue a single item on the batch writer and return its storage key."""
+        # Parse floats straight to Decimal for DynamoDB compatibility
+        item_data = json.loads(ITEM_ADAPTER.dump_json(item), parse_float=Decimal)
+        
+        # Prepare item data with PK/SK pattern
+        item_data["PK"] = item.id
+        item_data["SK"] = item.sk
+        
+        batch.put_item(Item=item_data)
+        
+        # Create storage key: PK#{id}#SK#{sk}
+        return f"PK#{item.id}#SK#{item.sk}"
+    
     def store_batch(self, items: list[DataItemOut]) -> list[str]:
-        """Store items to DynamoDB and return storage keys."""
-        keys = []
+        """Store items to DynamoDB in batched writes and return storage keys."""
+        # BatchWriteItem rejects repeated keys; fail before any write rather than
+        # letting a partial flush land (the writer does not dedup on PK/SK)
+        if len({(item.id, item.sk) for item in items}) != len(items):
+            raise StorageError("DynamoDB storage error: duplicate PK/SK in batch")
         
-        for item in items:
-            try:
-                # Prepare item data with PK/SK pattern
-                item_data = item.model_dump(mode="json")
-                item_data["PK"] = item.id
-                item_data["SK"] = item.sk
-                
-                # Convert float values to Decimal for DynamoDB compatibility
-                def convert_floats_to_decimals(obj):
-                    if isinstance(obj, dict):
-                        return {k: convert_floats_to_decimals(v) for k, v in obj.items()}
-                    elif isinstance(obj, list):
-                        return [convert_floats_to_decimals(v) for v in obj]
-                    elif isinstance(obj, float):
-                        return Decimal(str(obj))
-                    else:
-                        return obj
-                
-                item_data = convert_floats_to_decimals(item_data)
+        try:
+            # batch_writer groups puts into BatchWriteItem calls and retries unprocessed items
+            with self.table.batch_writer() as batch:
+                keys = [self._put_one(batch, item) for item in items]
                 
-                # Put item to DynamoDB
-                self.table.put_item(Item=item_data)
-                
-                # Create storage key: PK#{id}#SK#{sk}
-                key = f"PK#{item.id}#SK#{item.sk}"
-                keys.append(key)
-                
-                logger.info(f"Stored item {item.id} to DynamoDB: {key}")
-                
-            except (BotoCoreError, ClientError) as e:
-                logger.exception(f"Failed to store item {item.id} to DynamoDB: {e}")
-                raise StorageError(f"DynamoDB storage error: {e}")
+        except (BotoCoreError, ClientError) as e:
+            logger.exception("Failed to store batch to DynamoDB: %s", e)
+            raise StorageError(f"DynamoDB storage error: {e}")
         
+        logger.info("Stored %d items to DynamoDB table %s", len(keys), self.table_name)
         return keys
 
 
+@lru_cache(maxsize=1)
 def get_storage_from_env() -> Storage:
-    """Get storage backend based on environment configuration."""
+    """Get storage backend based on environment configuration.
+
+    The instance is cached so the boto3 client and its connection pool are
+    reused across requests. Call ``get_storage_from_env.cache_clear()`` after
+    changing the environment.
+    """
     settings = get_settings()
     
     if settings.storage_backend == "s3":
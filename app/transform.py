@@ -4,29 +4,50 @@ from datetime import datetime, timezone
 from app.schemas import DataItemIn, DataItemOut
 
 
+_SLUG_RE = re.compile(r'[^a-z0-9]+')
+
+# Byte translation table mapping every byte outside [a-z0-9] to '-'
+_SLUG_TABLE = bytes(
+    c if (0x61 <= c <= 0x7a or 0x30 <= c <= 0x39) else 0x2d
+    for c in range(256)
+)
+
+
 def slugify(text: str) -> str:
     """Convert text to URL-friendly slug."""
-    # Convert to lowercase and replace non-alphanumeric chars with hyphens
-    slug = re.sub(r'[^a-zA-Z0-9]+', '-', text.lower())
-    # Remove leading/trailing hyphens
-    slug = slug.strip('-')
-    return slug
+    text = text.lower()
+    try:
+        # ASCII fast path: translate non-alphanumerics to hyphens, then collapse runs
+        slug = text.encode('ascii').translate(_SLUG_TABLE).decode('ascii')
+    except UnicodeEncodeError:
+        # Replace non-alphanumeric chars with hyphens and remove leading/trailing hyphens
+        return _SLUG_RE.sub('-', text).strip('-')
+    return '-'.join(part for part in slug.split('-') if part)
+
 
+def transform_item(
+    item: DataItemIn,
+    now: datetime | None = None,
+    now_iso: str | None = None
+) -> DataItemOut:
+    """Transform input data item to output format with computed fields.
 
-def transform_item(item: DataItemIn) -> DataItemOut:
-    """Transform input data item to output format with computed fields."""
+    ``now`` and its ISO form ``now_iso`` may be passed in so a whole batch
+    shares one receive time; otherwise the current UTC time is used.
+    """
     
-    # Use provided timestamp or default to now (UTC)
-    timestamp = item.timestamp or datetime.now(timezone.utc)
+    if now is None:
+        now = datetime.now(timezone.utc)
+    if now_iso is None:
+        now_iso = now.isoformat()
     
-    # Set received_at to now (UTC)
-    received_at = datetime.now(timezone.utc)
+    # Use provided timestamp or default to now (UTC)
+    timestamp = item.timestamp or now
     
     # Transform fields
     name_upper = item.name.upper()
     value_times_two = item.value * 2
     slug = slugify(item.name)
-    sk = received_at.isoformat()
     
     return DataItemOut(
         id=item.id,
@@ -37,6 +58,12 @@ def transform_item(item: DataItemIn) -> DataItemOut:
         slug=slug,
         name_upper=name_upper,
         value_times_two=value_times_two,
-        received_at=received_at,
-        sk=sk
+        received_at=now,
+        sk=now_iso
     )
+
+
+def transform_batch(items: list[DataItemIn], now: datetime) -> list[DataItemOut]:
+    """Transform a batch of items that were all received at ``now``."""
+    now_iso = now.isoformat()
+    return [transform_item(item, now, now_iso) for item in items]
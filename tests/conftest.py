@@ -0,0 +1,14 @@
+import pytest
+
+from app.config import get_settings
+from app.storage import get_storage_from_env
+
+
+@pytest.fixture(autouse=True)
+def clear_cached_config():
+    """Reset cached settings and storage so each test picks up its own environment."""
+    get_settings.cache_clear()
+    get_storage_from_env.cache_clear()
+    yield
+    get_settings.cache_clear()
+    get_storage_from_env.cache_clear()
@@ -1,5 +1,8 @@
+import json
 import os
+import sys
 from datetime import datetime, timezone
+from decimal import Decimal
 
 import boto3
 import pytest
@@ -8,10 +11,11 @@ from moto import mock_aws
 
 from app.main import app
 from app.schemas import DataItemIn
-from app.transform import transform_item
+from app.storage import DynamoDBStorage, StorageError
+from app.transform import slugify, transform_batch, transform_item
 
-# Test client
-client = TestClient(app)
+# Test client, running on uvloop like production (uvloop is unavailable on Windows)
+client = TestClient(app, backend_options={"use_uvloop": sys.platform != "win32"})
 
 # Helper payload with two items
 test_payload = {
@@ -67,6 +71,27 @@ class TestTransform:
         assert result.timestamp == timestamp
         assert result.received_at is not None
         assert result.received_at != timestamp  # received_at should be now
+    
+    def test_transform_batch_shares_received_at(self):
+        """Test that batch transform stamps every item with the same receive time."""
+        now = datetime(2024, 6, 1, 8, 30, 0, tzinfo=timezone.utc)
+        items = [
+            DataItemIn(id="test-1", name="First", value=1.0),
+            DataItemIn(id="test-2", name="Second", value=2.0)
+        ]
+        
+        results = transform_batch(items, now)
+        
+        assert [r.id for r in results] == ["test-1", "test-2"]
+        assert all(r.received_at == now for r in results)
+        assert all(r.timestamp == now for r in results)
+        assert all(r.sk == now.isoformat() for r in results)
+    
+    def test_slugify_ascii_and_non_ascii(self):
+        """Test that ASCII fast path and non-ASCII fallback produce matching slugs."""
+        assert slugify("  Hello,  World!! ") == "hello-world"
+        assert slugify("---") == ""
+        assert slugify("Café au lait") == "caf-au-lait"
 
 
 class TestValidation:
@@ -95,6 +120,29 @@ class TestValidation:
         assert response.status_code == 422
 
 
+    @mock_aws
+    def test_validation_duplicate_ids(self):
+        """Test that repeated ids in one batch trigger 422 and nothing is stored."""
+        os.environ["STORAGE_BACKEND"] = "s3"
+        os.environ["S3_BUCKET"] = "test-bucket"
+        os.environ["AWS_REGION"] = "us-east-1"
+        
+        s3_client = boto3.client("s3", region_name="us-east-1")
+        s3_client.create_bucket(Bucket="test-bucket")
+        
+        invalid_payload = {
+            "items": [
+                {"id": "dup", "name": "First", "value": 1.0},
+                {"id": "dup", "name": "Second", "value": 2.0}
+            ]
+        }
+        
+        response = client.post("/ingest", json=invalid_payload)
+        assert response.status_code == 422
+        assert "Duplicate item ids in batch: dup" in response.text
+        assert s3_client.list_objects_v2(Bucket="test-bucket")["KeyCount"] == 0
+
+
 class TestS3Storage:
     """Test S3 storage functionality."""
     
@@ -122,6 +170,36 @@ class TestS3Storage:
         for key in result["keys"]:
             head_response = s3_client.head_object(Bucket="test-bucket", Key=key)
             assert head_response["ResponseMetadata"]["HTTPStatusCode"] == 200
+        
+        # Verify stored body is the serialized item and the key reuses its sort key
+        body = s3_client.get_object(Bucket="test-bucket", Key=result["keys"][0])["Body"].read()
+        stored_item = json.loads(body)
+        assert result["keys"][0] == f"items/test-1-{stored_item['sk']}.json"
+        assert stored_item["id"] == "test-1"
+        assert stored_item["slug"] == "test-item-1"
+        assert stored_item["value_times_two"] == 21.0
+    
+    @mock_aws
+    def test_s3_large_response_is_gzipped(self):
+        """Test that large ingest responses are gzip-compressed."""
+        os.environ["STORAGE_BACKEND"] = "s3"
+        os.environ["S3_BUCKET"] = "test-bucket"
+        os.environ["AWS_REGION"] = "us-east-1"
+        
+        s3_client = boto3.client("s3", region_name="us-east-1")
+        s3_client.create_bucket(Bucket="test-bucket")
+        
+        payload = {
+            "items": [
+                {"id": f"item-{i}", "name": f"Item {i}", "value": float(i)}
+                for i in range(50)
+            ]
+        }
+        response = client.post("/ingest", json=payload, headers={"Accept-Encoding": "gzip"})
+        
+        assert response.status_code == 201
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert response.json()["stored"] == 50
     
     @mock_aws
     def test_s3_failure_path(self):
@@ -177,6 +255,43 @@ class TestDynamoDBStorage:
         # Verify items exist in DynamoDB
         scan_response = table.scan()
         assert scan_response["Count"] == 2
+        
+        # Verify floats are stored as Decimal values
+        values = {item["id"]: item["value"] for item in scan_response["Items"]}
+        assert values == {"test-1": Decimal("10.5"), "test-2": Decimal("25.0")}
+
+
+    @mock_aws
+    def test_dynamodb_duplicate_keys_fail(self):
+        """Test that items sharing PK/SK in one batch raise instead of being dropped."""
+        dynamodb = boto3.resource("dynamodb", region_name="us-east-1")
+        table = dynamodb.create_table(
+            TableName="test-table",
+            KeySchema=[
+                {"AttributeName": "PK", "KeyType": "HASH"},
+                {"AttributeName": "SK", "KeyType": "RANGE"}
+            ],
+            AttributeDefinitions=[
+                {"AttributeName": "PK", "AttributeType": "S"},
+                {"AttributeName": "SK", "AttributeType": "S"}
+            ],
+            BillingMode="PAY_PER_REQUEST"
+        )
+        table.wait_until_exists()
+        
+        now = datetime.now(timezone.utc)
+        items = transform_batch(
+            [
+                DataItemIn(id="dup", name="First", value=1.0),
+                DataItemIn(id="dup", name="Second", value=2.0)
+            ],
+            now
+        )
+        
+        with pytest.raises(StorageError):
+            DynamoDBStorage("test-table").store_batch(items)
+        
+        assert table.scan()["Count"] == 0
 
 
 class TestHealthEndpoint:
@@ -188,9 +303,10 @@ class TestHealthEndpoint:
         os.environ["STORAGE_BACKEND"] = "s3"
         os.environ["AWS_REGION"] = "us-west-2"
         
-        response = client.get("/health")
+        response = client.get("/health", headers={"Accept-Encoding": "gzip"})
         
         assert response.status_code == 200
+        assert "Content-Encoding" not in response.headers
         result = response.json()
         assert result["status"] == "ok"
         assert result["storage_backend"] == "s3"
@@ -214,9 +330,10 @@ class TestRequestIDMiddleware:
         
         assert response.status_code == 200
         assert "X-Request-ID" in response.headers
-        # Should be a UUID
+        # Should be a UUID in 32-char hex form
         import uuid
+        request_id = response.headers["X-Request-ID"]
         try:
-            uuid.UUID(response.headers["X-Request-ID"])
+            assert uuid.UUID(request_id).hex == request_id
         except ValueError:
             pytest.fail("X-Request-ID is not a valid UUID")